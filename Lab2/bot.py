@@ -1,12 +1,17 @@
 import asyncio
+import csv
+import functools
 import json
 import logging
 import os
+import tempfile
+import threading
 from dataclasses import dataclass
-from datetime import datetime, time, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime, time, timedelta, tzinfo
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import pytz
 from dotenv import load_dotenv
 from pathlib import Path
 from telegram import Update
@@ -19,9 +24,13 @@ from telegram.ext import (
     JobQueue,
 )
 try:
-    import pandas as pd  # type: ignore
-except Exception:  # noqa: BLE001
-    pd = None  # Loaded lazily; handlers will validate availability
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # Falls back to the stdlib json module
+try:
+    from rapidfuzz import fuzz, process  # type: ignore
+except ImportError:
+    fuzz = process = None  # /find then only does substring matching
 
 
 # Configure logging early
@@ -39,37 +48,112 @@ logger = logging.getLogger(__name__)
 DATA_FILE = os.path.join(os.path.dirname(__file__), "data.json")
 
 
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Parsed data.json keyed on (st_mtime_ns, st_size); refreshed when the file changes.
+_DATA_CACHE: Dict[str, Any] = {"key": None, "value": {}}
+# Handlers run load_data in worker threads; serialize access to the cache
+_DATA_LOCK = threading.Lock()
+
+
 def load_data() -> Dict[str, Any]:
-    """Load JSON data from DATA_FILE with basic error handling."""
+    """Load JSON data from DATA_FILE with basic error handling.
+
+    The parsed dict is cached until the file changes on disk and is shared
+    between callers, so it must not be mutated in place.
+    """
+    with _DATA_LOCK:
+        try:
+            st = os.stat(DATA_FILE)
+            key = (st.st_mtime_ns, st.st_size)
+            if _DATA_CACHE["key"] == key:
+                return _DATA_CACHE["value"]
+            with open(DATA_FILE, "rb") as f:
+                data = _json_loads(f.read())
+            _DATA_CACHE["key"] = key
+            _DATA_CACHE["value"] = data
+            return data
+        except FileNotFoundError:
+            logger.error("data.json not found at %s", DATA_FILE)
+            return {}
+        except json.JSONDecodeError as exc:
+            logger.error("Failed to parse data.json: %s", exc)
+            return {}
+
+
+async def load_data_async() -> Dict[str, Any]:
+    """Return the cached data after a stat on the loop; read and parse in a
+    worker thread only when data.json has changed."""
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        logger.error("data.json not found at %s", DATA_FILE)
-        return {}
-    except json.JSONDecodeError as exc:
-        logger.error("Failed to parse data.json: %s", exc)
-        return {}
+        st = os.stat(DATA_FILE)
+        if _DATA_CACHE["key"] == (st.st_mtime_ns, st.st_size):
+            return _DATA_CACHE["value"]
+    except OSError:
+        pass  # load_data reports it
+    return await asyncio.to_thread(load_data)
 
 
-def save_data(data: Dict[str, Any]) -> None:
-    """Persist JSON data back to DATA_FILE safely."""
+# ----------------------------
+# Subscribers (append-only log)
+# ----------------------------
+
+SUBSCRIBERS_FILE = os.path.join(os.path.dirname(__file__), "subscribers.txt")
+
+# Loaded once at startup by load_subscribers and then only appended to
+_SUBSCRIBERS: Set[int] = set()
+
+
+def load_subscribers() -> Set[int]:
+    """Read SUBSCRIBERS_FILE (one chat_id per line) into the in-memory set.
+
+    On first run the legacy "subscribers" list from data.json is copied into
+    the file, so existing subscriptions survive the move.
+    """
+    if not os.path.exists(SUBSCRIBERS_FILE):
+        legacy = load_data().get("subscribers", [])
+        try:
+            with open(SUBSCRIBERS_FILE, "w", encoding="utf-8") as f:
+                f.writelines(f"{chat_id}\n" for chat_id in legacy)
+        except OSError as exc:
+            logger.error("Failed to create %s: %s", SUBSCRIBERS_FILE, exc)
+        _SUBSCRIBERS.update(int(chat_id) for chat_id in legacy)
+        return _SUBSCRIBERS
+    with open(SUBSCRIBERS_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                _SUBSCRIBERS.add(int(line))
+            except ValueError:
+                logger.warning("Skipping malformed subscriber line: %r", line)
+    return _SUBSCRIBERS
+
+
+def append_subscriber(chat_id: int) -> bool:
+    """Persist one new subscriber by appending a line; O(1) regardless of count."""
     try:
-        tmp_path = DATA_FILE + ".tmp"
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        os.replace(tmp_path, DATA_FILE)
-    except Exception as exc:  # noqa: BLE001 - top-level safety
-        logger.error("Failed to save data.json: %s", exc)
+        with open(SUBSCRIBERS_FILE, "a", encoding="utf-8") as f:
+            f.write(f"{chat_id}\n")
+        return True
+    except OSError as exc:
+        logger.error("Failed to save subscriber %s: %s", chat_id, exc)
+        return False
 
 
-def get_timezone() -> pytz.BaseTzInfo:
+@functools.lru_cache(maxsize=1)
+def get_timezone() -> ZoneInfo:
+    """Resolve TIMEZONE once; the first call must happen after .env is loaded."""
     tz_name = os.getenv("TIMEZONE", "Europe/Moscow")
     try:
-        return pytz.timezone(tz_name)
-    except Exception:
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
         logger.warning("Invalid TIMEZONE '%s', falling back to Europe/Moscow", tz_name)
-        return pytz.timezone("Europe/Moscow")
+        return ZoneInfo("Europe/Moscow")
 
 
 # ----------------------------
@@ -91,13 +175,13 @@ def code(text: str) -> str:
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Register user for digests and greet."""
     user_first = update.effective_user.first_name if update.effective_user else ""
-    data = load_data()
-    subscribers: List[int] = data.get("subscribers", [])
     chat_id = update.effective_chat.id if update.effective_chat else None
-    if chat_id is not None and chat_id not in subscribers:
-        subscribers.append(chat_id)
-        data["subscribers"] = subscribers
-        save_data(data)
+    if chat_id is not None and chat_id not in _SUBSCRIBERS:
+        # Added before the await so a concurrent /start can't append it twice
+        _SUBSCRIBERS.add(chat_id)
+        if not await asyncio.to_thread(append_subscriber, chat_id):
+            # Keep the set in line with the file so the next /start retries
+            _SUBSCRIBERS.discard(chat_id)
 
     text = (
         f"Привет, {user_first}! Я бот компании {bold('ТралалелоТралала')}\n"
@@ -125,7 +209,7 @@ async def help_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 
 async def company(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
+    data = await load_data_async()
     company_info = data.get("company", {})
     name = company_info.get("name", "Компания")
     industry = company_info.get("industry", "Сфера деятельности")
@@ -134,7 +218,7 @@ async def company(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 
 async def team(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
+    data = await load_data_async()
     team_members = data.get("team", [])
     if not team_members:
         await update.effective_message.reply_text("Нет данных о команде.")
@@ -146,7 +230,7 @@ async def team(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 
 async def contacts(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
+    data = await load_data_async()
     contacts_data = data.get("contacts", {})
     ivan_phone = contacts_data.get("ivanovs_phone", "—")
     oleg_email = contacts_data.get("oleg_email", "—")
@@ -158,12 +242,12 @@ async def contacts(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     await update.effective_message.reply_text(text, parse_mode=ParseMode.HTML)
 
 
-def _weekday_name(dt: datetime, tz: pytz.BaseTzInfo) -> str:
+def _weekday_name(dt: datetime, tz: tzinfo) -> str:
     return dt.astimezone(tz).strftime("%A")
 
 
 async def events(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
+    data = await load_data_async()
     events_data: List[Dict[str, str]] = data.get("events", [])
     if not events_data:
         await update.effective_message.reply_text("Ближайших событий нет.")
@@ -181,7 +265,7 @@ async def events(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 async def digest(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     tz = get_timezone()
     today_weekday_ru = weekday_ru(datetime.now(tz))
-    data = load_data()
+    data = await load_data_async()
     digests = data.get("digests", {})
     msg = digests.get(today_weekday_ru)
     if not msg:
@@ -196,101 +280,247 @@ async def digest(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 EMPLOYEES_CSV = os.path.join(os.path.dirname(__file__), "employees.csv")
 EMPLOYEES_XLSX = os.path.join(os.path.dirname(__file__), "employees.xlsx")
+# Columnar snapshot of EMPLOYEES_XLSX; rebuilt whenever the workbook is newer
+EMPLOYEES_FEATHER = os.path.join(os.path.dirname(__file__), "employees.feather")
+
+
+REQUIRED_EMPLOYEE_COLUMNS = ("name", "department", "position", "email", "phone", "hire_date")
+# Columns searched by /staff and /find; a lowercased copy is kept as "<col>_lc"
+SEARCH_COLUMNS = ("name", "department", "position")
+
+
+@dataclass
+class _EmployeesCache:
+    """Parsed employees file together with the stat key it was built from.
+
+    Rows are stored column-wise: columns["name"][i] is the name of row i.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    count: int
+    columns: Dict[str, List[str]]
+    departments_sorted: List[str]
+
+
+_EMP_CACHE: Optional[_EmployeesCache] = None
 
 
-def _load_employees_df() -> Optional["pd.DataFrame"]:
+def _read_employees_rows(path: str) -> Tuple[List[str], List[List[str]]]:
+    """Return (header, rows) of the employees file as plain strings."""
+    if path == EMPLOYEES_CSV:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            rows = [row for row in csv.reader(f) if row]
+        if not rows:
+            return [], []
+        return rows[0], rows[1:]
+    # Excel still goes through pandas/openpyxl, imported only when needed
+    import pandas as pd  # type: ignore
+
+    try:
+        if os.stat(EMPLOYEES_FEATHER).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            df = pd.read_feather(EMPLOYEES_FEATHER)
+            return list(df.columns), df.values.tolist()
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # noqa: BLE001 - a broken snapshot is just rebuilt
+        logger.warning("Ignoring unreadable %s: %s", EMPLOYEES_FEATHER, exc)
+    df = pd.read_excel(path).fillna("").astype(str)
+    df.columns = [str(c) for c in df.columns]
+    tmp_path = None
+    try:
+        # Needs pyarrow; without it every cold start parses the workbook again.
+        # Loads may run in several worker threads, so each writes its own temp
+        # file and renames it into place; readers never see a partial snapshot.
+        fd, tmp_path = tempfile.mkstemp(
+            prefix="employees.", suffix=".feather.tmp", dir=os.path.dirname(EMPLOYEES_FEATHER)
+        )
+        os.close(fd)
+        df.to_feather(tmp_path)
+        os.replace(tmp_path, EMPLOYEES_FEATHER)
+        tmp_path = None
+    except Exception as exc:  # noqa: BLE001
+        logger.info("Could not write %s: %s", EMPLOYEES_FEATHER, exc)
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return list(df.columns), df.values.tolist()
+
+
+def _load_employees() -> Optional[_EmployeesCache]:
     """Load employees from CSV or Excel. Returns None on error.
 
+    The parsed file is cached and re-read only when its mtime or size changes.
     Expected columns: name,department,position,email,phone,hire_date
     """
-    if pd is None:
-        logger.warning("pandas is not installed; CSV/Excel features are unavailable")
-        return None
+    global _EMP_CACHE
     try:
         if os.path.exists(EMPLOYEES_CSV):
-            df = pd.read_csv(EMPLOYEES_CSV)
+            path = EMPLOYEES_CSV
         elif os.path.exists(EMPLOYEES_XLSX):
-            df = pd.read_excel(EMPLOYEES_XLSX)
+            path = EMPLOYEES_XLSX
         else:
             logger.info("No employees file found (CSV/XLSX)")
+            _EMP_CACHE = None
             return None
+        st = os.stat(path)
+        cached = _EMP_CACHE
+        if (
+            cached is not None
+            and cached.path == path
+            and cached.mtime_ns == st.st_mtime_ns
+            and cached.size == st.st_size
+        ):
+            return cached
+        header, rows = _read_employees_rows(path)
         # Normalize columns
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        required = ["name", "department", "position", "email", "phone", "hire_date"]
-        for col in required:
-            if col not in df.columns:
+        header = [str(c).strip().lower() for c in header]
+        for col in REQUIRED_EMPLOYEE_COLUMNS:
+            if col not in header:
                 logger.error("Employees file missing column '%s'", col)
                 return None
-        return df
+        columns: Dict[str, List[str]] = {}
+        for col in REQUIRED_EMPLOYEE_COLUMNS:
+            idx = header.index(col)
+            columns[col] = [row[idx] if idx < len(row) else "" for row in rows]
+        for col in SEARCH_COLUMNS:
+            columns[col + "_lc"] = [value.lower() for value in columns[col]]
+        # One lowercased blob per row so /find scans a single column; the unit
+        # separator keeps a needle from matching across two fields
+        columns["_blob_lc"] = [
+            "\x1f".join(values) for values in zip(*(columns[c + "_lc"] for c in SEARCH_COLUMNS))
+        ]
+        _EMP_CACHE = _EmployeesCache(
+            path=path,
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            count=len(rows),
+            columns=columns,
+            departments_sorted=sorted({d for d in columns["department"] if d}),
+        )
+        return _EMP_CACHE
+    except ImportError:
+        logger.warning("pandas is not installed; Excel features are unavailable")
+        return None
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to load employees file: %s", exc)
         return None
 
 
-def _fmt_employee_row(row: Dict[str, Any]) -> str:
+async def _load_employees_async() -> Optional[_EmployeesCache]:
+    """Like load_data_async: cache hits are answered on the loop, misses are
+    parsed in a worker thread."""
+    cached = _EMP_CACHE
+    if cached is not None and (cached.path == EMPLOYEES_CSV or not os.path.exists(EMPLOYEES_CSV)):
+        try:
+            st = os.stat(cached.path)
+            if cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+                return cached
+        except OSError:
+            pass
+    return await asyncio.to_thread(_load_employees)
+
+
+def _fmt_employee_row(name: str, position: str, department: str, email: str, phone: str) -> str:
     return (
-        f"- {row.get('name')} — {row.get('position')} ({row.get('department')})\n"
-        f"  email: {row.get('email')}, phone: {row.get('phone')}"
+        f"- {name} — {position} ({department})\n"
+        f"  email: {email}, phone: {phone}"
     )
 
 
-def _ilike(series, needle: str):  # type: ignore[no-untyped-def]
-    pattern = str(needle).strip().lower()
-    return series.astype(str).str.lower().str.contains(pattern, na=False)
+def _fmt_employee_rows(emp: _EmployeesCache, indices: List[int]) -> List[str]:
+    cols = emp.columns
+    names, positions, depts = cols["name"], cols["position"], cols["department"]
+    emails, phones = cols["email"], cols["phone"]
+    return [_fmt_employee_row(names[i], positions[i], depts[i], emails[i], phones[i]) for i in indices]
+
+
+def _ilike_lc(column_lc: List[str], needle_lc: str) -> List[int]:
+    """Indices of rows whose lowercased value contains the lowercased needle."""
+    return [i for i, value in enumerate(column_lc) if needle_lc in value]
+
+
+# Fuzzy fallback kicks in when the substring pass finds fewer rows than this
+FUZZY_MIN_HITS = 3
+FUZZY_SCORE_CUTOFF = 75
+
+
+def _fuzzy_hits(emp: _EmployeesCache, needle_lc: str, limit: int = 10) -> List[int]:
+    """Row indices that approximately match needle_lc, best score first.
+
+    Empty when rapidfuzz isn't installed.
+    """
+    if process is None:
+        return []
+    best: Dict[int, float] = {}
+    for col in SEARCH_COLUMNS:
+        for _, score, idx in process.extract(
+            needle_lc, emp.columns[col + "_lc"], scorer=fuzz.WRatio, limit=limit, score_cutoff=FUZZY_SCORE_CUTOFF
+        ):
+            if score > best.get(idx, 0):
+                best[idx] = score
+    return sorted(best, key=best.__getitem__, reverse=True)[:limit]
 
 
 async def departments(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    df = _load_employees_df()
-    if df is None or df.empty:
+    emp = await _load_employees_async()
+    if emp is None or emp.count == 0:
         await update.effective_message.reply_text("Файл сотрудников не найден или пуст.")
         return
-    depts = sorted(d for d in df["department"].dropna().unique())
-    if not depts:
+    if not emp.departments_sorted:
         await update.effective_message.reply_text("Отделы не найдены.")
         return
-    await update.effective_message.reply_text("Отделы:\n" + "\n".join(f"- {d}" for d in depts))
+    await update.effective_message.reply_text("Отделы:\n" + "\n".join(f"- {d}" for d in emp.departments_sorted))
 
 
 async def staff(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """List staff. Usage: /staff [отдел]"""
-    df = _load_employees_df()
-    if df is None or df.empty:
+    emp = await _load_employees_async()
+    if emp is None or emp.count == 0:
         await update.effective_message.reply_text("Файл сотрудников не найден или пуст.")
         return
     args = context.args or []
-    filtered = df
+    hits = list(range(emp.count))
     if args:
-        dept_query = " ".join(args)
-        filtered = df[_ilike(df["department"], dept_query)]
-    if filtered.empty:
+        dept_query = " ".join(args).strip().lower()
+        hits = _ilike_lc(emp.columns["department_lc"], dept_query)
+    if not hits:
         await update.effective_message.reply_text("Сотрудники не найдены по заданному фильтру.")
         return
     # Limit to 20 to keep messages short
-    rows = filtered.head(20).to_dict(orient="records")
-    lines = ["Сотрудники:"] + [_fmt_employee_row(r) for r in rows]
+    lines = ["Сотрудники:"] + _fmt_employee_rows(emp, hits[:20])
     await update.effective_message.reply_text("\n".join(lines))
 
 
 async def find(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Full-text like search across name/department/position.
 
+    Several words are matched independently: /find ведущий маркет
     Usage: /find маркет
     """
-    df = _load_employees_df()
-    if df is None or df.empty:
+    emp = await _load_employees_async()
+    if emp is None or emp.count == 0:
         await update.effective_message.reply_text("Файл сотрудников не найден или пуст.")
         return
     query = " ".join(context.args or []).strip()
     if not query:
         await update.effective_message.reply_text("Использование: /find <строка поиска>")
         return
-    mask = _ilike(df["name"], query) | _ilike(df["department"], query) | _ilike(df["position"], query)
-    result = df[mask]
-    if result.empty:
+    # Every whitespace-separated term must occur somewhere in the row
+    terms = query.lower().split()
+    hits = [i for i, blob in enumerate(emp.columns["_blob_lc"]) if all(t in blob for t in terms)]
+    if len(hits) < FUZZY_MIN_HITS:
+        # Second round tolerates typos; exact matches stay first
+        seen = set(hits)
+        hits += [i for i in _fuzzy_hits(emp, query.lower()) if i not in seen]
+    if not hits:
         await update.effective_message.reply_text("Ничего не найдено.")
         return
-    rows = result.head(20).to_dict(orient="records")
-    lines = ["Найдено:"] + [_fmt_employee_row(r) for r in rows]
+    lines = ["Найдено:"] + _fmt_employee_rows(emp, hits[:20])
     await update.effective_message.reply_text("\n".join(lines))
 
 
@@ -298,63 +528,71 @@ async def find(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 # Scheduling: digests and reminders
 # ----------------------------
 
+# Monday=0 ... Sunday=6
+_WEEKDAY_RU = ("Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье")
+
+# Inverse of _WEEKDAY_RU, built once at import so the two can't drift apart
+_RU_TO_PY_WEEKDAY = MappingProxyType({name: idx for idx, name in enumerate(_WEEKDAY_RU)})
+
+
 def weekday_ru(dt: datetime) -> str:
-    # Monday=0 ... Sunday=6
-    mapping = {
-        0: "Понедельник",
-        1: "Вторник",
-        2: "Среда",
-        3: "Четверг",
-        4: "Пятница",
-        5: "Суббота",
-        6: "Воскресенье",
-    }
-    return mapping[dt.weekday()]
+    return _WEEKDAY_RU[dt.weekday()]
 
 
 def ru_to_py_weekday(ru: str) -> int:
-    mapping = {
-        "Понедельник": 0,
-        "Вторник": 1,
-        "Среда": 2,
-        "Четверг": 3,
-        "Пятница": 4,
-        "Суббота": 5,
-        "Воскресенье": 6,
-    }
-    return mapping[ru]
+    return _RU_TO_PY_WEEKDAY[ru]
+
+
+# HTTP pool for outbound Bot API calls; getUpdates gets its own connection
+CONNECTION_POOL_SIZE = 32
+# Upper bound on in-flight send_message calls during a broadcast; half of the
+# pool stays free for command replies
+BROADCAST_CONCURRENCY = CONNECTION_POOL_SIZE // 2
+
+
+async def _broadcast(context: ContextTypes.DEFAULT_TYPE, chat_ids: Iterable[int], text: str, kind: str) -> None:
+    """Send text to every chat concurrently, at most BROADCAST_CONCURRENCY at a time."""
+    sem = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async def send_one(chat_id: int) -> None:
+        async with sem:
+            try:
+                await context.bot.send_message(chat_id=chat_id, text=text)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to send %s to %s: %s", kind, chat_id, exc)
+
+    await asyncio.gather(*(send_one(chat_id) for chat_id in chat_ids), return_exceptions=True)
 
 
 async def send_daily_digest(context: ContextTypes.DEFAULT_TYPE) -> None:
-    tz = get_timezone()
-    today_ru = weekday_ru(datetime.now(tz))
-    data = load_data()
-    digests = data.get("digests", {})
-    msg = digests.get(today_ru)
+    if not _SUBSCRIBERS:
+        return
+    today_ru = weekday_ru(datetime.now(get_timezone()))
+    # Resolved once per broadcast and shared by every recipient
+    msg = (await load_data_async()).get("digests", {}).get(today_ru)
     if not msg:
         return
-    for chat_id in data.get("subscribers", []):
-        try:
-            await context.bot.send_message(chat_id=chat_id, text=msg)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to send digest to %s: %s", chat_id, exc)
+    await _broadcast(context, _SUBSCRIBERS, msg, "digest")
 
 
 async def send_event_reminder(context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
-    events_data: List[Dict[str, str]] = data.get("events", [])
-    if not events_data:
+    """Remind subscribers about every event scheduled for this job's slot.
+
+    The slot's events come from job.data, but each one is checked against the
+    current data.json (cached, so this is usually just a stat): events removed
+    or moved since startup are skipped and edited descriptions are used.
+    """
+    if not _SUBSCRIBERS:
         return
+    data = await load_data_async()
+    current = {(ev.get("day"), ev.get("title"), ev.get("time")): ev for ev in data.get("events", [])}
     job_data = context.job.data or {}
-    title = job_data.get("title")
-    time_str = job_data.get("time")
-    description = job_data.get("description")
-    text = f"Напоминание: {title} в {time_str}. {description}"
-    for chat_id in data.get("subscribers", []):
-        try:
-            await context.bot.send_message(chat_id=chat_id, text=text)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to send event reminder to %s: %s", chat_id, exc)
+    for ev in job_data.get("events", []):
+        live = current.get((ev.get("day"), ev.get("title"), ev.get("time")))
+        if live is None:
+            continue
+        text = f"Напоминание: {live.get('title')} в {live.get('time')}. {live.get('description')}"
+        await _broadcast(context, _SUBSCRIBERS, text, "event reminder")
 
 
 def schedule_jobs(app: Application) -> None:
@@ -368,7 +606,9 @@ def schedule_jobs(app: Application) -> None:
         name="daily_digest",
     )
 
-    # Event reminders 15 minutes before the event time, weekly
+    # Event reminders 15 minutes before the event time, weekly. Events that
+    # share a (weekday, reminder time) slot are served by a single job.
+    slots: Dict[Tuple[int, time], List[Dict[str, Any]]] = {}
     data = load_data()
     for ev in data.get("events", []):
         try:
@@ -378,20 +618,26 @@ def schedule_jobs(app: Application) -> None:
             dt_dummy = datetime.now(tz).replace(hour=ev_time.hour, minute=ev_time.minute, second=0, microsecond=0)
             remind_dt = dt_dummy - timedelta(minutes=15)
             remind_time = time(hour=remind_dt.hour, minute=remind_dt.minute, tzinfo=tz)
-            jq.run_daily(
-                send_event_reminder,
-                time=remind_time,
-                days=(weekday_idx,),
-                data={
+            slots.setdefault((weekday_idx, remind_time), []).append(
+                {
+                    "day": ev.get("day"),
                     "title": ev.get("title"),
                     "time": ev.get("time"),
                     "description": ev.get("description"),
-                },
-                name=f"reminder_{weekday_idx}_{ev.get('time')}",
+                }
             )
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to schedule reminder for event %s: %s", ev, exc)
 
+    for (weekday_idx, remind_time), slot_events in slots.items():
+        jq.run_daily(
+            send_event_reminder,
+            time=remind_time,
+            days=(weekday_idx,),
+            data={"events": slot_events},
+            name=f"reminder_{weekday_idx}_{remind_time.strftime('%H:%M')}",
+        )
+
 
 # ----------------------------
 # Error handler
@@ -415,26 +661,24 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
 def build_application() -> Application:
     # Explicitly load .env from the project directory to avoid CWD issues
     env_path = Path(__file__).with_name('.env')
-    load_dotenv(dotenv_path=str(env_path), override=True)
+    # utf-8-sig tolerates the BOM Windows editors like to prepend
+    load_dotenv(dotenv_path=str(env_path), override=True, encoding="utf-8-sig")
     token = os.getenv("BOT_TOKEN")
-    if not token and env_path.exists():
-        try:
-            with env_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.lstrip('\ufeff').strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if line.startswith("BOT_TOKEN="):
-                        token = line.split("=", 1)[1].strip()
-                        if token:
-                            os.environ["BOT_TOKEN"] = token
-                        break
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to read .env manually: %s", exc)
     if not token:
         raise RuntimeError("BOT_TOKEN is not set. Provide it via environment or .env file.")
 
-    application = ApplicationBuilder().token(token).build()
+    application = (
+        ApplicationBuilder()
+        .token(token)
+        .connection_pool_size(CONNECTION_POOL_SIZE)
+        .pool_timeout(20)
+        .connect_timeout(10)
+        .read_timeout(30)
+        # Long polling holds its connection open; keep it off the send pool
+        .get_updates_connection_pool_size(1)
+        .get_updates_pool_timeout(60)
+        .build()
+    )
 
     # Handlers
     application.add_handler(CommandHandler("start", start))
@@ -452,13 +696,26 @@ def build_application() -> Application:
     # Errors
     application.add_error_handler(error_handler)
 
-    # Jobs
+    # Subscribers and jobs
+    load_subscribers()
     schedule_jobs(application)
 
     return application
 
 
+def _install_uvloop() -> None:
+    try:
+        import uvloop  # type: ignore
+    except ImportError:  # not available on Windows; stay on the default loop
+        return
+    # Not uvloop.install(): uvloop deprecated it (0.18+, on Python 3.12+) in
+    # favour of uvloop.run(). run_polling creates its loop from the policy.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 def main() -> None:
+    _install_uvloop()
     app = build_application()
     logger.info("Bot is starting...")
     app.run_polling(allowed_updates=Update.ALL_TYPES)
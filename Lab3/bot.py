@@ -1,59 +1,169 @@
+import asyncio
 import json
 import logging
 import os
+import tempfile
+import threading
+from collections import defaultdict
+from functools import lru_cache, reduce
 from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import pytz
-from dotenv import load_dotenv
+import aiofiles
 from telegram import Update
 from telegram.constants import ParseMode
-from telegram.ext import Application, ApplicationBuilder, CommandHandler, ContextTypes, JobQueue
+from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
+from telegram.ext import AIORateLimiter, Application, ApplicationBuilder, CommandHandler, ContextTypes, JobQueue
 
 try:
-    import pandas as pd  # type: ignore
-except Exception:
-    pd = None
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# numpy/pandas/pyarrow are imported on first employees lookup (see _import_pandas),
+# so /start, /help and the reminder jobs don't pay for them
+np = None
+pd = None
+pa = None
+pc = None
+_PANDAS_IMPORTED: Optional[bool] = None
 
 logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_FILE = os.path.join(BASE_DIR, "data.json")
+SUBS_FILE = os.path.join(BASE_DIR, "subscribers.log")
 EMPLOYEES_CSV = os.path.join(BASE_DIR, "employees.csv")
 EMPLOYEES_XLSX = os.path.join(BASE_DIR, "employees.xlsx")
+EMPLOYEES_PARQUET = os.path.join(BASE_DIR, "employees.parquet")
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+class OrjsonHTTPXRequest(HTTPXRequest):
+    # Bot API responses (getUpdates batches, sendMessage results) decoded with orjson
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> Dict[str, Any]:
+        try:
+            return _json_loads(payload)
+        except ValueError as exc:
+            raise TelegramError("Invalid server response") from exc
+
+
+_DATA_CACHE: Dict[str, Any] = {"mtime": -1, "data": {}}
+
+
+def _cache_data(mtime: int, data: Dict[str, Any]) -> None:
+    _DATA_CACHE["mtime"] = mtime
+    _DATA_CACHE["data"] = data
 
 
 def load_data() -> Dict[str, Any]:
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        mtime = os.stat(DATA_FILE).st_mtime_ns
+        if mtime == _DATA_CACHE["mtime"]:
+            return _DATA_CACHE["data"]
+        with open(DATA_FILE, "rb") as f:
+            data = _json_loads(f.read())
+        _cache_data(mtime, data)
+        return data
     except FileNotFoundError:
         logger.error("data.json not found at %s", DATA_FILE)
+        _cache_data(-1, {})
         return {}
     except json.JSONDecodeError as exc:
         logger.error("Failed to parse data.json: %s", exc)
         return {}
 
 
-def save_data(data: Dict[str, Any]) -> None:
+async def load_data_async() -> Dict[str, Any]:
     try:
-        tmp = DATA_FILE + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        os.replace(tmp, DATA_FILE)
-    except Exception as exc:
-        logger.error("Failed to save data.json: %s", exc)
+        # a plain stat on the loop: cache hits cost no executor round trip
+        mtime = os.stat(DATA_FILE).st_mtime_ns
+        if mtime == _DATA_CACHE["mtime"]:
+            return _DATA_CACHE["data"]
+        async with aiofiles.open(DATA_FILE, "rb") as f:
+            raw = await f.read()
+        data = await asyncio.to_thread(_json_loads, raw)
+        _cache_data(mtime, data)
+        return data
+    except FileNotFoundError:
+        logger.error("data.json not found at %s", DATA_FILE)
+        _cache_data(-1, {})
+        return {}
+    except json.JSONDecodeError as exc:
+        logger.error("Failed to parse data.json: %s", exc)
+        return {}
+
 
+# Subscribers: append-only log, one chat_id per line, loaded once at startup
+_SUBSCRIBERS: Set[int] = set()
 
-def get_timezone() -> pytz.BaseTzInfo:
-    tz_name = os.getenv("TIMEZONE", "Europe/Moscow")
+
+def load_subscribers() -> Set[int]:
+    if not os.path.exists(SUBS_FILE):
+        # one-time move of the old "subscribers" list from data.json
+        legacy = load_data().get("subscribers", [])
+        try:
+            with open(SUBS_FILE, "w", encoding="utf-8") as f:
+                f.writelines(f"{cid}\n" for cid in legacy)
+        except OSError as exc:
+            logger.error("Failed to create %s: %s", SUBS_FILE, exc)
+            _SUBSCRIBERS.update(int(cid) for cid in legacy)
+            return _SUBSCRIBERS
     try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        logger.warning("Invalid TIMEZONE '%s', fallback to Europe/Moscow", tz_name)
-        return pytz.timezone("Europe/Moscow")
+        with open(SUBS_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    _SUBSCRIBERS.add(int(line))
+                except ValueError:
+                    logger.warning("Skipping malformed subscriber line: %r", line)
+    except OSError as exc:
+        logger.error("Failed to read %s: %s", SUBS_FILE, exc)
+    return _SUBSCRIBERS
+
+
+async def add_subscriber(chat_id: int) -> None:
+    if chat_id in _SUBSCRIBERS:
+        return
+    # added before the await so a concurrent /subscribe doesn't append a duplicate line
+    _SUBSCRIBERS.add(chat_id)
+    try:
+        async with aiofiles.open(SUBS_FILE, "a", encoding="utf-8") as f:
+            await f.write(f"{chat_id}\n")
+    except OSError as exc:
+        _SUBSCRIBERS.discard(chat_id)
+        logger.error("Failed to save subscriber %s: %s", chat_id, exc)
+
+
+@lru_cache(maxsize=1)
+def _tz_for(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+# Resolved on first use, i.e. after build_application has loaded .env
+_TZ: Optional[ZoneInfo] = None
+
+
+def get_timezone() -> ZoneInfo:
+    global _TZ
+    if _TZ is None:
+        tz_name = os.getenv("TIMEZONE", "Europe/Moscow")
+        try:
+            _TZ = _tz_for(tz_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning("Invalid TIMEZONE '%s', fallback to Europe/Moscow", tz_name)
+            _TZ = _tz_for("Europe/Moscow")
+    return _TZ
 
 
 def bold(text: str) -> str:
@@ -64,52 +174,74 @@ def code(text: str) -> str:
     return f"<code>{text}</code>"
 
 
+# Static replies are built once at import
+START_TEXT_TAIL = (
+    f"Я бот компании {bold('ТралалелоТралала')}\n"
+    "Помогу с информацией о компании, контактах, событиях и пришлю дайджест.\n"
+    f"Посмотри {code('/help')} для списка команд."
+)
+
+HELP_TEXT = (
+    "Доступные команды:\n"
+    "/start — приветствие и подписка на дайджесты\n"
+    "/help — список команд\n"
+    "/company — информация о компании\n"
+    "/team — состав команды\n"
+    "/contacts — контакты сотрудников\n"
+    "/events — предстоящие события\n"
+    "/digest — сегодняшний дайджест\n"
+    "/departments — отделы из файла сотрудников\n"
+    "/staff — список сотрудников (опц. отдел)\n"
+    "/find — поиск сотрудников по имени/должности/отделу"
+)
+
+
+async def _data_version() -> int:
+    # mtime of the data.json snapshot currently cached; refreshes the cache first
+    await load_data_async()
+    return _DATA_CACHE["mtime"]
+
+
+@lru_cache(maxsize=1)
+def _company_text(version: int) -> str:
+    company_info = _DATA_CACHE["data"].get("company", {})
+    name = company_info.get("name", "Компания")
+    industry = company_info.get("industry", "Сфера деятельности")
+    return f"{bold(name)}\nСфера: {industry}"
+
+
+@lru_cache(maxsize=1)
+def _contacts_text(version: int) -> str:
+    contacts_data = _DATA_CACHE["data"].get("contacts", {})
+    ivan_phone = contacts_data.get("ivanovs_phone", "—")
+    oleg_email = contacts_data.get("oleg_email", "—")
+    oleg_phone = contacts_data.get("oleg_phone", "—")
+    return (
+        f"Ивановы (общий): {code(ivan_phone)}\n"
+        f"Олег Арсипов: {code(oleg_email)}, {code(oleg_phone)}"
+    )
+
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user_first = update.effective_user.first_name if update.effective_user else ""
-    data = load_data()
-    subscribers: List[int] = data.get("subscribers", [])
     chat_id = update.effective_chat.id if update.effective_chat else None
-    if chat_id is not None and chat_id not in subscribers:
-        subscribers.append(chat_id)
-        data["subscribers"] = subscribers
-        save_data(data)
-
-    text = (
-        f"Привет, {user_first}! Я бот компании {bold('ТралалелоТралала')}\n"
-        "Помогу с информацией о компании, контактах, событиях и пришлю дайджест.\n"
-        f"Посмотри {code('/help')} для списка команд."
-    )
+    if chat_id is not None:
+        await add_subscriber(chat_id)
+
+    text = f"Привет, {user_first}! {START_TEXT_TAIL}"
     await update.effective_message.reply_text(text, parse_mode=ParseMode.HTML)
 
 
 async def help_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    text = (
-        "Доступные команды:\n"
-        "/start — приветствие и подписка на дайджесты\n"
-        "/help — список команд\n"
-        "/company — информация о компании\n"
-        "/team — состав команды\n"
-        "/contacts — контакты сотрудников\n"
-        "/events — предстоящие события\n"
-        "/digest — сегодняшний дайджест\n"
-        "/departments — отделы из файла сотрудников\n"
-        "/staff — список сотрудников (опц. отдел)\n"
-        "/find — поиск сотрудников по имени/должности/отделу"
-    )
-    await update.effective_message.reply_text(text)
+    await update.effective_message.reply_text(HELP_TEXT)
 
 
 async def company(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
-    company_info = data.get("company", {})
-    name = company_info.get("name", "Компания")
-    industry = company_info.get("industry", "Сфера деятельности")
-    text = f"{bold(name)}\nСфера: {industry}"
-    await update.effective_message.reply_text(text, parse_mode=ParseMode.HTML)
+    await update.effective_message.reply_text(_company_text(await _data_version()), parse_mode=ParseMode.HTML)
 
 
 async def team(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
+    data = await load_data_async()
     team_members = data.get("team", [])
     if not team_members:
         await update.effective_message.reply_text("Нет данных о команде.")
@@ -121,25 +253,21 @@ async def team(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 
 async def contacts(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
-    contacts_data = data.get("contacts", {})
-    ivan_phone = contacts_data.get("ivanovs_phone", "—")
-    oleg_email = contacts_data.get("oleg_email", "—")
-    oleg_phone = contacts_data.get("oleg_phone", "—")
-    text = (
-        f"Ивановы (общий): {code(ivan_phone)}\n"
-        f"Олег Арсипов: {code(oleg_email)}, {code(oleg_phone)}"
-    )
-    await update.effective_message.reply_text(text, parse_mode=ParseMode.HTML)
+    await update.effective_message.reply_text(_contacts_text(await _data_version()), parse_mode=ParseMode.HTML)
+
+
+_WEEKDAY_RU = ("Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье")
+
+
+_WEEKDAY_IDX = {name: i for i, name in enumerate(_WEEKDAY_RU)}
 
 
 def weekday_ru(dt: datetime) -> str:
-    mapping = {0: "Понедельник", 1: "Вторник", 2: "Среда", 3: "Четверг", 4: "Пятница", 5: "Суббота", 6: "Воскресенье"}
-    return mapping[dt.weekday()]
+    return _WEEKDAY_RU[dt.weekday()]
 
 
 async def events(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
+    data = await load_data_async()
     events_data: List[Dict[str, str]] = data.get("events", [])
     if not events_data:
         await update.effective_message.reply_text("Ближайших событий нет.")
@@ -153,7 +281,7 @@ async def events(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 async def digest(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     tz = get_timezone()
     today_weekday_ru = weekday_ru(datetime.now(tz))
-    data = load_data()
+    data = await load_data_async()
     digests = data.get("digests", {})
     msg = digests.get(today_weekday_ru)
     if not msg:
@@ -164,71 +292,271 @@ async def digest(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 # Employees CSV/Excel
 
-def _load_employees_df() -> Optional["pd.DataFrame"]:
-    if pd is None:
-        logger.warning("pandas is not installed; CSV/Excel features are unavailable")
-        return None
-    try:
+def _import_pandas() -> bool:
+    global np, pd, pa, pc, _PANDAS_IMPORTED
+    if _PANDAS_IMPORTED is None:
+        try:
+            import numpy as np  # type: ignore
+            import pandas as pd  # type: ignore
+            _PANDAS_IMPORTED = True
+        except Exception:
+            _PANDAS_IMPORTED = False
+            logger.warning("pandas is not installed; CSV/Excel features are unavailable")
+        if _PANDAS_IMPORTED:
+            try:
+                import pyarrow as pa  # type: ignore
+                import pyarrow.compute as pc  # type: ignore
+            except ImportError:
+                pass
+    return _PANDAS_IMPORTED
+
+
+_EMP_PATH: Optional[str] = None
+_EMP_PATH_RESOLVED = False
+
+
+def _employees_source() -> Optional[str]:
+    # Cached once a file is found; afterwards only the mtime stat in _load_employees_df
+    # touches the disk. Until then every call re-checks, so a file added later is picked up
+    global _EMP_PATH, _EMP_PATH_RESOLVED
+    if not _EMP_PATH_RESOLVED:
         if os.path.exists(EMPLOYEES_CSV):
-            df = pd.read_csv(EMPLOYEES_CSV)
+            _EMP_PATH = EMPLOYEES_CSV
         elif os.path.exists(EMPLOYEES_XLSX):
-            df = pd.read_excel(EMPLOYEES_XLSX)
+            _EMP_PATH = EMPLOYEES_XLSX
         else:
-            logger.info("No employees file found (CSV/XLSX)")
             return None
+        _EMP_PATH_RESOLVED = True
+    return _EMP_PATH
+
+
+def _parquet_is_fresh(src: str) -> bool:
+    try:
+        return os.stat(EMPLOYEES_PARQUET).st_mtime_ns >= os.stat(src).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _read_employees_csv(path: str) -> "pd.DataFrame":
+    # pyarrow's multi-threaded reader, yielding Arrow-backed columns; pandas' parser otherwise
+    try:
+        import pyarrow.csv as pacsv  # type: ignore
+    except ImportError:
+        return pd.read_csv(path)
+    table = pacsv.read_csv(path, read_options=pacsv.ReadOptions(use_threads=True))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def convert_employees_to_parquet(force: bool = False) -> Optional["pd.DataFrame"]:
+    # One-time CSV/XLSX -> Parquet conversion; reruns only when the source is newer
+    # (or when forced, e.g. to replace an unreadable snapshot).
+    # Returns the frame it parsed (None if nothing was read) so callers needn't re-read the parquet
+    src = _employees_source()
+    if src is None or (not force and _parquet_is_fresh(src)) or not _import_pandas():
+        return None
+    try:
+        if src == EMPLOYEES_CSV:
+            df = _read_employees_csv(src)
+        else:
+            df = pd.read_excel(src, dtype_backend="pyarrow")
+    except Exception as exc:
+        logger.warning("Failed to read %s: %s", os.path.basename(src), exc)
+        return None
+    tmp = None
+    try:
+        # temp file + rename: a crash mid-write never leaves a truncated "fresh" snapshot
+        fd, tmp = tempfile.mkstemp(prefix="employees.", suffix=".parquet.tmp", dir=os.path.dirname(EMPLOYEES_PARQUET))
+        os.close(fd)
+        df.to_parquet(tmp, engine="pyarrow", index=False)
+        os.replace(tmp, EMPLOYEES_PARQUET)
+        tmp = None
+        logger.info("Converted %s to %s", os.path.basename(src), os.path.basename(EMPLOYEES_PARQUET))
+    except Exception as exc:
+        logger.warning("Failed to convert employees file to parquet: %s", exc)
+    finally:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    return df
+
+
+_EMP_CACHE: Dict[str, Any] = {"key": None, "df": None, "trigrams": {}, "blob": None, "departments_text": "", "columns": ()}
+
+
+def _build_search_blob(df: "pd.DataFrame") -> Optional["pa.ChunkedArray"]:
+    # name \x1f position \x1f department per row (lowercased) as one Arrow column,
+    # so /find runs one substring kernel instead of three column scans
+    if pc is None:
+        return None
+    cols = [pa.chunked_array([pa.array(df[f"_{c}_lc"].fillna(""), type=pa.string())]) for c in ("name", "position", "department")]
+    return pc.binary_join_element_wise(*cols, "\x1f")
+
+
+def _find_rows(df: "pd.DataFrame", needle: str) -> "np.ndarray":
+    # Positions of rows matching needle (already lowercased) in name/position/department
+    candidates = _trigram_candidates(needle)
+    blob = _EMP_CACHE["blob"]
+    if blob is None:
+        sub = df if candidates is None else df.iloc[candidates]
+        mask = (_ilike(sub, "name", needle) | _ilike(sub, "department", needle) | _ilike(sub, "position", needle)).to_numpy()
+    else:
+        # only rows holding all the needle's 3-grams need the substring check
+        sub = blob if candidates is None else blob.take(candidates)
+        mask = pc.fill_null(pc.match_substring(sub, needle), False).to_numpy(zero_copy_only=False)
+    rows = np.flatnonzero(mask)
+    return rows if candidates is None else candidates[rows]
+
+
+def _build_trigram_index(df: "pd.DataFrame") -> Dict[str, "np.ndarray"]:
+    # 3-gram -> sorted row positions over lowercased name/position/department
+    postings: Dict[str, List[int]] = defaultdict(list)
+    cols = [df[f"_{c}_lc"].fillna("").tolist() for c in ("name", "position", "department")]
+    for i, values in enumerate(zip(*cols)):
+        blob = "\x1f".join(values)
+        for gram in {blob[j:j + 3] for j in range(len(blob) - 2)}:
+            postings[gram].append(i)
+    return {gram: np.array(rows, dtype=np.int32) for gram, rows in postings.items()}
+
+
+def _trigram_candidates(needle: str) -> Optional["np.ndarray"]:
+    # Row positions that contain every 3-gram of needle; None if needle is too short
+    if len(needle) < 3:
+        return None
+    index = _EMP_CACHE["trigrams"]
+    lists = []
+    for gram in {needle[j:j + 3] for j in range(len(needle) - 2)}:
+        rows = index.get(gram)
+        if rows is None:
+            return np.empty(0, dtype=np.int32)
+        lists.append(rows)
+    lists.sort(key=len)
+    return reduce(np.intersect1d, lists)
+
+
+# (Re)loads run in worker threads; one at a time so the parquet file isn't written twice
+_EMP_LOCK = threading.Lock()
+
+
+async def _employees_df() -> Optional["pd.DataFrame"]:
+    # Cache hits stay on the event loop (one stat); a (re)load, which may
+    # convert to parquet and import pandas, goes to a worker thread
+    path = _employees_source()
+    if path is not None and _EMP_CACHE["key"] is not None:
+        try:
+            if (path, os.stat(path).st_mtime_ns) == _EMP_CACHE["key"]:
+                return _EMP_CACHE["df"]
+        except OSError:
+            pass
+    return await asyncio.to_thread(_load_employees_df)
+
+
+def _load_employees_df() -> Optional["pd.DataFrame"]:
+    with _EMP_LOCK:
+        return _load_employees_df_locked()
+
+
+def _load_employees_df_locked() -> Optional["pd.DataFrame"]:
+    global _EMP_PATH_RESOLVED
+    path = _employees_source()
+    if path is None:
+        logger.info("No employees file found (CSV/XLSX)")
+        return None
+    if not _import_pandas():
+        return None
+    try:
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            # source was removed or renamed; look it up again next time
+            _EMP_PATH_RESOLVED = False
+            raise
+        if key == _EMP_CACHE["key"]:
+            return _EMP_CACHE["df"]
+        # a fresh conversion hands back the frame it parsed; otherwise read the snapshot
+        df = convert_employees_to_parquet()
+        if df is None and _parquet_is_fresh(path):
+            try:
+                df = pd.read_parquet(EMPLOYEES_PARQUET, engine="pyarrow", dtype_backend="pyarrow")
+            except Exception as exc:
+                # broken snapshot: parse the source again and rewrite it
+                logger.warning("Ignoring unreadable %s: %s", os.path.basename(EMPLOYEES_PARQUET), exc)
+                df = convert_employees_to_parquet(force=True)
+        if df is None:
+            if path == EMPLOYEES_CSV:
+                df = _read_employees_csv(path)
+            else:
+                df = pd.read_excel(path)
         df.columns = [str(c).strip().lower() for c in df.columns]
         required = ["name", "department", "position", "email", "phone", "hire_date"]
         for col in required:
             if col not in df.columns:
                 logger.error("Employees file missing column '%s'", col)
                 return None
+        # Lowercased once per load; _ilike only lowercases the needle
+        for col in ("name", "department", "position"):
+            df[f"_{col}_lc"] = df[col].astype("string[pyarrow]" if pa is not None else "string").str.lower()
+        depts = sorted(str(d) for d in df["department"].dropna().unique())
+        # published in one dict.update so handlers on the loop never see a half-built entry
+        _EMP_CACHE.update({
+            "key": key,
+            "df": df,
+            "trigrams": _build_trigram_index(df),
+            "blob": _build_search_blob(df),
+            "columns": tuple(df[c].to_numpy() for c in ("name", "position", "department", "email", "phone")),
+            "departments_text": ("Отделы:\n" + "\n".join(f"- {d}" for d in depts)) if depts else "Отделы не найдены.",
+        })
         return df
     except Exception as exc:
         logger.error("Failed to load employees file: %s", exc)
         return None
 
 
-def _fmt_employee_row(row: Dict[str, Any]) -> str:
-    return f"- {row.get('name')} — {row.get('position')} ({row.get('department')})\n  email: {row.get('email')}, phone: {row.get('phone')}"
+def _fmt_employees(rows, limit: int = 20) -> List[str]:  # type: ignore
+    # rows are positions into the cached column arrays; no filtered DataFrame is built
+    idx = rows[:limit]
+    names, positions, depts, emails, phones = (col[idx] for col in _EMP_CACHE["columns"])
+    return [
+        f"- {names[i]} — {positions[i]} ({depts[i]})\n  email: {emails[i]}, phone: {phones[i]}"
+        for i in range(len(idx))
+    ]
 
 
-def _ilike(series, needle: str):  # type: ignore
+def _ilike(df, col: str, needle: str):  # type: ignore
     pattern = str(needle).strip().lower()
-    return series.astype(str).str.lower().str.contains(pattern, na=False)
+    return df[f"_{col}_lc"].str.contains(pattern, na=False, regex=False)
 
 
 async def departments(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    df = _load_employees_df()
+    df = await _employees_df()
     if df is None or df.empty:
         await update.effective_message.reply_text("Файл сотрудников не найден или пуст.")
         return
-    depts = sorted(d for d in df["department"].dropna().unique())
-    if not depts:
-        await update.effective_message.reply_text("Отделы не найдены.")
-        return
-    await update.effective_message.reply_text("Отделы:\n" + "\n".join(f"- {d}" for d in depts))
+    # built alongside the DataFrame in _load_employees_df
+    await update.effective_message.reply_text(_EMP_CACHE["departments_text"])
 
 
 async def staff(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    df = _load_employees_df()
+    df = await _employees_df()
     if df is None or df.empty:
         await update.effective_message.reply_text("Файл сотрудников не найден или пуст.")
         return
     args = context.args or []
-    filtered = df
     if args:
         dept_query = " ".join(args)
-        filtered = df[_ilike(df["department"], dept_query)]
-    if filtered.empty:
+        rows = np.flatnonzero(_ilike(df, "department", dept_query).to_numpy())
+    else:
+        rows = np.arange(len(df))
+    if rows.size == 0:
         await update.effective_message.reply_text("Сотрудники не найдены по заданному фильтру.")
         return
-    rows = filtered.head(20).to_dict(orient="records")
-    lines = ["Сотрудники:"] + [_fmt_employee_row(r) for r in rows]
+    lines = ["Сотрудники:"] + _fmt_employees(rows)
     await update.effective_message.reply_text("\n".join(lines))
 
 
 async def find(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    df = _load_employees_df()
+    df = await _employees_df()
     if df is None or df.empty:
         await update.effective_message.reply_text("Файл сотрудников не найден или пуст.")
         return
@@ -236,49 +564,58 @@ async def find(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not query:
         await update.effective_message.reply_text("Использование: /find <строка поиска>")
         return
-    mask = _ilike(df["name"], query) | _ilike(df["department"], query) | _ilike(df["position"], query)
-    result = df[mask]
-    if result.empty:
+    rows = _find_rows(df, query.lower())
+    if rows.size == 0:
         await update.effective_message.reply_text("Ничего не найдено.")
         return
-    rows = result.head(20).to_dict(orient="records")
-    lines = ["Найдено:"] + [_fmt_employee_row(r) for r in rows]
+    lines = ["Найдено:"] + _fmt_employees(rows)
     await update.effective_message.reply_text("\n".join(lines))
 
 
 # Schedules
 
-def weekday_ru(dt: datetime) -> str:
-    mapping = {0: "Понедельник", 1: "Вторник", 2: "Среда", 3: "Четверг", 4: "Пятница", 5: "Суббота", 6: "Воскресенье"}
-    return mapping[dt.weekday()]
+# Caps how many sends a broadcast has in flight at once; the per-second pacing
+# (Telegram's ~30 msg/s) is left to AIORateLimiter
+_BROADCAST_SEM = asyncio.Semaphore(25)
+
+
+async def _broadcast(context: ContextTypes.DEFAULT_TYPE, chat_ids: Iterable[int], text: str, what: str) -> None:
+    async def _one(chat_id: int) -> None:
+        async with _BROADCAST_SEM:
+            try:
+                await context.bot.send_message(chat_id=chat_id, text=text)
+            except Exception as exc:
+                logger.warning("Failed to send %s to %s: %s", what, chat_id, exc)
+
+    await asyncio.gather(*(_one(c) for c in chat_ids), return_exceptions=True)
 
 
 async def send_daily_digest(context: ContextTypes.DEFAULT_TYPE) -> None:
     tz = get_timezone()
     today_ru = weekday_ru(datetime.now(tz))
-    data = load_data()
+    data = await load_data_async()
     msg = data.get("digests", {}).get(today_ru)
     if not msg:
         return
-    for chat_id in data.get("subscribers", []):
-        try:
-            await context.bot.send_message(chat_id=chat_id, text=msg)
-        except Exception as exc:
-            logger.warning("Failed to send digest to %s: %s", chat_id, exc)
+    await _broadcast(context, _SUBSCRIBERS, msg, "digest")
 
 
 async def send_event_reminder(context: ContextTypes.DEFAULT_TYPE) -> None:
-    data = load_data()
+    data = await load_data_async()
     events = data.get("events", [])
     if not events:
         return
     job_data = context.job.data or {}
     text = f"Напоминание: {job_data.get('title')} в {job_data.get('time')}. {job_data.get('description')}"
-    for chat_id in data.get("subscribers", []):
-        try:
-            await context.bot.send_message(chat_id=chat_id, text=text)
-        except Exception as exc:
-            logger.warning("Failed to send event reminder to %s: %s", chat_id, exc)
+    await _broadcast(context, _SUBSCRIBERS, text, "event reminder")
+
+
+def _parse_hhmm(value: str) -> time:
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        # fromisoformat needs zero-padded "09:30"; strptime also takes "9:30"
+        return datetime.strptime(value, "%H:%M").time()
 
 
 def schedule_jobs(app: Application) -> None:
@@ -288,9 +625,8 @@ def schedule_jobs(app: Application) -> None:
     data = load_data()
     for ev in data.get("events", []):
         try:
-            weekdays = {"Понедельник": 0, "Вторник": 1, "Среда": 2, "Четверг": 3, "Пятница": 4, "Суббота": 5, "Воскресенье": 6}
-            weekday_idx = weekdays[ev.get("day", "Понедельник")]
-            ev_time = datetime.strptime(ev.get("time", "00:00"), "%H:%M").time()
+            weekday_idx = _WEEKDAY_IDX[ev.get("day", "Понедельник")]
+            ev_time = _parse_hhmm(ev.get("time", "00:00"))
             dt_dummy = datetime.now(tz).replace(hour=ev_time.hour, minute=ev_time.minute, second=0, microsecond=0)
             remind_dt = dt_dummy - timedelta(minutes=15)
             remind_time = time(hour=remind_dt.hour, minute=remind_dt.minute, tzinfo=tz)
@@ -315,12 +651,23 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
 
 
 def build_application() -> Application:
+    from dotenv import load_dotenv
+
     env_path = Path(__file__).with_name('.env')
     load_dotenv(dotenv_path=str(env_path), override=True)
     token = os.getenv("BOT_TOKEN")
     if not token:
         raise RuntimeError("BOT_TOKEN is not set. Provide it via .env")
-    app = ApplicationBuilder().token(token).build()
+    # HTTP/2: broadcast sends are multiplexed over a few persistent connections
+    app = (
+        ApplicationBuilder()
+        .token(token)
+        .request(OrjsonHTTPXRequest(http_version="2", connection_pool_size=64))
+        .get_updates_request(OrjsonHTTPXRequest(http_version="2", connection_pool_size=1))
+        # max_retries: a RetryAfter (flood wait) is slept out and the send retried
+        .rate_limiter(AIORateLimiter(max_retries=3))
+        .build()
+    )
     app.add_handler(CommandHandler("start", start))
     app.add_handler(CommandHandler("help", help_cmd))
     app.add_handler(CommandHandler("company", company))
@@ -332,13 +679,16 @@ def build_application() -> Application:
     app.add_handler(CommandHandler("staff", staff))
     app.add_handler(CommandHandler("find", find))
     app.add_error_handler(error_handler)
+    load_subscribers()
     schedule_jobs(app)
     return app
 
 
 def main() -> None:
     app = build_application()
-    use_webhook = os.getenv("USE_WEBHOOK", "0") == "1"
+    public_base = os.getenv("PUBLIC_URL")  # e.g. https://xxx.ngrok-free.app
+    # webhook whenever a public URL is configured; USE_WEBHOOK=0/1 forces the mode
+    use_webhook = os.getenv("USE_WEBHOOK", "1" if public_base else "0") == "1"
     if not use_webhook:
         logger.info("Starting in polling mode...")
         app.run_polling(allowed_updates=Update.ALL_TYPES)
@@ -348,12 +698,19 @@ def main() -> None:
     host = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
     port = int(os.getenv("WEBHOOK_PORT", "8080"))
     path = os.getenv("WEBHOOK_PATH", "/webhook")
-    public_base = os.getenv("PUBLIC_URL")  # e.g. https://xxx.ngrok-free.app
     if not public_base:
         raise RuntimeError("PUBLIC_URL must be set for webhook mode (your ngrok URL)")
     webhook_url = public_base.rstrip("/") + path
+    secret_token = os.getenv("WEBHOOK_SECRET_TOKEN") or None
     logger.info("Starting webhook on %s:%s, url=%s", host, port, webhook_url)
-    app.run_webhook(listen=host, port=port, url_path=path.lstrip("/"), webhook_url=webhook_url, allowed_updates=Update.ALL_TYPES)
+    app.run_webhook(
+        listen=host,
+        port=port,
+        url_path=path.lstrip("/"),
+        webhook_url=webhook_url,
+        allowed_updates=Update.ALL_TYPES,
+        secret_token=secret_token,
+    )
 
 
 if __name__ == "__main__":